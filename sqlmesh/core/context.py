@@ -761,7 +761,9 @@ class Context(BaseContext):
                                 )
                             )
                 file.seek(0)
-                file.write(format_model_expressions(expressions, transpile or model.dialect))
+                file.write(
+                    format_model_expressions(expressions, transpile or model.dialect, copy=False)
+                )
                 if newline:
                     file.write("\n")
                 file.truncate()
@@ -17,6 +17,7 @@ from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotChangeCategory,
     SnapshotDataVersion,
+    SnapshotFingerprint,
     SnapshotId,
     SnapshotTableInfo,
 )
@@ -57,6 +58,8 @@ class ContextDiff(PydanticModel):
     previously_promoted_model_names: t.Set[str]
     """Models that were promoted by the previous plan."""
 
+    _text_diff_cache: t.Dict[t.Tuple[SnapshotFingerprint, SnapshotFingerprint], str] = {}
+
     @classmethod
     def create(
         cls,
@@ -88,44 +91,48 @@ class ContextDiff(PydanticModel):
             is_new_environment = False
             previously_promoted_model_names = {s.name for s in env.promoted_snapshots}
 
-        existing_info = {info.name: info for info in (env.snapshots if env else [])}
-        existing_nodes = set(existing_info)
-        current_nodes = set(snapshots)
-        removed = existing_nodes - current_nodes
-        added = current_nodes - existing_nodes
-        modified_info = {
-            name: existing_info[name]
-            for name, snapshot in snapshots.items()
-            if name not in added and snapshot.fingerprint != existing_info[name].fingerprint
-        }
+        existing_info: t.Dict[str, SnapshotTableInfo] = {}
+        modified_info: t.Dict[str, SnapshotTableInfo] = {}
+
+        for info in env.snapshots if env else []:
+            existing_info[info.name] = info
+            current = snapshots.get(info.name)
+            if current and current.fingerprint != info.fingerprint:
+                modified_info[info.name] = info
+
+        removed = existing_info.keys() - snapshots.keys()
+        added = snapshots.keys() - existing_info.keys()
+
+        # Snapshot ids are derived from fingerprints on every access, so compute them only once.
+        snapshot_ids = {name: snapshot.snapshot_id for name, snapshot in snapshots.items()}
+        modified_remote_snapshot_ids = {name: s.snapshot_id for name, s in modified_info.items()}
 
         modified_local_seed_snapshot_ids = {
-            s.snapshot_id for s in snapshots.values() if s.is_seed and s.name in modified_info
+            snapshot_ids[name] for name in modified_info if snapshots[name].is_seed
         }
-        modified_remote_snapshot_ids = {s.snapshot_id for s in modified_info.values()}
-
-        stored = {
-            **state_reader.get_snapshots(
-                [
-                    snapshot.snapshot_id
-                    for snapshot in snapshots.values()
-                    if snapshot.snapshot_id not in modified_local_seed_snapshot_ids
-                ]
-            ),
-            **state_reader.get_snapshots(
-                modified_remote_snapshot_ids | modified_local_seed_snapshot_ids,
-                hydrate_seeds=True,
-            ),
+
+        # Only snapshots that require seed hydration are fetched separately, every other id is
+        # requested exactly once and all results are indexed into a single mapping.
+        hydrated_snapshot_ids = {
+            *modified_remote_snapshot_ids.values(),
+            *modified_local_seed_snapshot_ids,
         }
+        stored = state_reader.get_snapshots(
+            {s_id for s_id in snapshot_ids.values() if s_id not in hydrated_snapshot_ids}
+        )
+        if hydrated_snapshot_ids:
+            # Skip the extra round trip to the state store when nothing was modified.
+            stored.update(state_reader.get_snapshots(hydrated_snapshot_ids, hydrate_seeds=True))
 
         merged_snapshots = {}
         modified_snapshots = {}
         new_snapshots = {}
-        snapshot_remote_versions: t.Dict[str, t.Tuple[t.Tuple[SnapshotDataVersion, ...], int]] = {}
+        modified_existing_snapshots = []
 
         for name, snapshot in snapshots.items():
             modified = modified_info.get(name)
-            existing = stored.get(snapshot.snapshot_id)
+            snapshot_id = snapshot_ids[name]
+            existing = stored.get(snapshot_id)
 
             if modified and snapshot.node_type != modified.node_type:
                 added.add(snapshot.name)
@@ -137,42 +144,54 @@ class ContextDiff(PydanticModel):
 
                 merged_snapshots[name] = existing.copy()
                 if modified:
-                    modified_snapshots[name] = (existing, stored[modified.snapshot_id])
-                    for child, versions in existing.indirect_versions.items():
-                        existing_versions = snapshot_remote_versions.get(child)
-                        if not existing_versions or existing_versions[1] < existing.created_ts:
-                            snapshot_remote_versions[child] = (
-                                versions,
-                                existing.created_ts,
-                            )
+                    modified_snapshots[name] = (
+                        existing,
+                        stored[modified_remote_snapshot_ids[name]],
+                    )
+                    modified_existing_snapshots.append(existing)
             else:
                 snapshot = snapshot.copy()
                 merged_snapshots[name] = snapshot
-                new_snapshots[snapshot.snapshot_id] = snapshot
+                new_snapshots[snapshot_id] = snapshot
                 if modified:
                     snapshot.previous_versions = modified.all_versions
-                    modified_snapshots[name] = (snapshot, stored[modified.snapshot_id])
-
-        for snapshot in new_snapshots.values():
-            if (
-                snapshot.name in snapshot_remote_versions
-                and snapshot.previous_version
-                and snapshot.data_hash_matches(snapshot.previous_version)
-            ):
-                remote_versions = snapshot_remote_versions[snapshot.name][0]
+                    modified_snapshots[name] = (
+                        snapshot,
+                        stored[modified_remote_snapshot_ids[name]],
+                    )
+
+        # Remote versions are only relevant for children that are new snapshots.
+        new_snapshots_by_name = {snapshot.name: snapshot for snapshot in new_snapshots.values()}
+        snapshot_remote_versions: t.Dict[str, t.Tuple[t.Tuple[SnapshotDataVersion, ...], int]] = {}
+
+        for existing in modified_existing_snapshots:
+            for child, versions in existing.indirect_versions.items():
+                if child not in new_snapshots_by_name:
+                    continue
+                existing_versions = snapshot_remote_versions.get(child)
+                if not existing_versions or existing_versions[1] < existing.created_ts:
+                    snapshot_remote_versions[child] = (versions, existing.created_ts)
+
+        # Only new snapshots with remote versions may need their version reconciled.
+        for name, (remote_versions, _) in snapshot_remote_versions.items():
+            snapshot = new_snapshots_by_name[name]
+            if snapshot.previous_version and snapshot.data_hash_matches(snapshot.previous_version):
                 remote_head = remote_versions[-1]
                 local_head = snapshot.previous_version
+                local_version_set = {local.version for local in snapshot.previous_versions}
+                remote_version_set = {remote.version for remote in remote_versions}
 
-                if remote_head.version in (local.version for local in snapshot.previous_versions):
+                if remote_head.version in local_version_set:
                     snapshot.version = local_head.version
                     snapshot.change_category = local_head.change_category
-                elif local_head.version in (remote.version for remote in remote_versions):
+                elif local_head.version in remote_version_set:
                     snapshot.version = remote_head.version
                     snapshot.change_category = remote_head.change_category
                 else:
                     snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
 
-        return ContextDiff(
+        # All values are built above with the expected types, so validation can be skipped.
+        return ContextDiff.construct(
             environment=environment,
             is_new_environment=is_new_environment,
             is_unfinalized_environment=bool(env and not env.finalized_ts),
@@ -286,4 +305,7 @@ class ContextDiff(PydanticModel):
             return ""
 
         new, old = self.modified_snapshots[node]
-        return old.node.text_diff(new.node)
+        key = (old.fingerprint, new.fingerprint)
+        if key not in self._text_diff_cache:
+            self._text_diff_cache[key] = old.node.text_diff(new.node)
+        return self._text_diff_cache[key]
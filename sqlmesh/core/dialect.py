@@ -4,7 +4,7 @@ import functools
 import re
 import sys
 import typing as t
-from difflib import unified_diff
+from difflib import SequenceMatcher
 from enum import Enum, auto
 
 import pandas as pd
@@ -126,7 +126,8 @@ def _parse_statement(self: Parser) -> t.Optional[exp.Expression]:
     if self._curr is None:
         return None
 
-    parser = PARSERS.get(self._curr.text.upper())
+    text = self._curr.text
+    parser = PARSERS.get(text.upper()) if text[:1].upper() in PARSER_FIRST_CHARS else None
 
     if parser:
         # Capture any available description in the form of a comment
@@ -183,12 +184,20 @@ def _parse_macro(self: Parser, keyword_macro: str = "") -> t.Optional[exp.Expres
     return self.expression(MacroVar, this=field.this)
 
 
-KEYWORD_MACROS = {"WITH", "JOIN", "WHERE", "GROUP_BY", "HAVING", "ORDER_BY"}
+KEYWORD_MACROS = frozenset({"WITH", "JOIN", "WHERE", "GROUP_BY", "HAVING", "ORDER_BY"})
 
 
 def _parse_matching_macro(self: Parser, name: str) -> t.Optional[exp.Expression]:
-    if not self._match_pair(TokenType.PARAMETER, TokenType.VAR, advance=False) or (
-        self._next and self._next.text.upper() != name.upper()
+    # Most tokens aren't macros, so reject them before looking ahead
+    curr = self._curr
+    if curr is None or curr.token_type != TokenType.PARAMETER:
+        return None
+
+    next_token = self._next
+    if (
+        next_token is None
+        or next_token.token_type != TokenType.VAR
+        or next_token.text.upper() != name
     ):
         return None
 
@@ -363,7 +372,7 @@ def _parse_if(self: Parser) -> t.Optional[exp.Expression]:
         return exp.Anonymous(this="IF", expressions=[cond, statement])
 
 
-def _create_parser(parser_type: t.Type[exp.Expression], table_keys: t.List[str]) -> t.Callable:
+def _create_parser(parser_type: t.Type[exp.Expression], table_key: str) -> t.Callable:
     def parse(self: Parser) -> t.Optional[exp.Expression]:
         from sqlmesh.core.model.kind import ModelKindName
 
@@ -380,7 +389,7 @@ def _create_parser(parser_type: t.Type[exp.Expression], table_keys: t.List[str])
             start = self._curr
             value: t.Optional[exp.Expression | str]
 
-            if key in table_keys:
+            if key == table_key:
                 value = self._parse_table_parts()
             elif key == "columns":
                 value = self._parse_schema()
@@ -426,11 +435,14 @@ def _create_parser(parser_type: t.Type[exp.Expression], table_keys: t.List[str])
 
 
 PARSERS = {
-    "MODEL": _create_parser(Model, ["name"]),
-    "AUDIT": _create_parser(Audit, ["model"]),
-    "METRIC": _create_parser(Metric, ["name"]),
+    "MODEL": _create_parser(Model, "name"),
+    "AUDIT": _create_parser(Audit, "model"),
+    "METRIC": _create_parser(Metric, "name"),
 }
 
+# Used to skip upper casing the text of statements that can't be a SQLMesh DDL
+PARSER_FIRST_CHARS = frozenset(name[0] for name in PARSERS)
+
 
 def _sqlmesh_ddl_sql(self: Generator, expression: Model | Audit | Metric, name: str) -> str:
     props = ",\n".join(
@@ -466,18 +478,25 @@ def _macro_func_sql(self: Generator, expression: MacroFunc) -> str:
 
 def _override(klass: t.Type[Tokenizer | Parser], func: t.Callable) -> None:
     name = func.__name__
-    setattr(klass, f"_{name}", getattr(klass, name))
+    original_name = f"_{name}"
+
+    # Overriding twice would make the original method point to the override itself
+    if original_name in klass.__dict__:
+        return
+
+    setattr(klass, original_name, getattr(klass, name))
     setattr(klass, name, func)
 
 
 def format_model_expressions(
-    expressions: t.List[exp.Expression], dialect: t.Optional[str] = None
+    expressions: t.List[exp.Expression], dialect: t.Optional[str] = None, copy: bool = True
 ) -> str:
     """Format a model's expressions into a standardized format.
 
     Args:
         expressions: The model's expressions, must be at least model def + query.
         dialect: The dialect to render the expressions as.
+        copy: Whether to copy the query before formatting it. If False, the query is modified in place.
 
     Returns:
         A string representing the formatted model.
@@ -486,7 +505,8 @@ def format_model_expressions(
         return expressions[0].sql(pretty=True, dialect=dialect)
 
     *statements, query = expressions
-    query = query.copy()
+    if copy:
+        query = query.copy()
     selects = []
 
     for expression in query.expressions:
@@ -495,7 +515,8 @@ def format_model_expressions(
         expression.comments = None
 
         if not isinstance(expression, exp.Alias) and expression.output_name not in ("", "*"):
-            expression = expression.replace(exp.alias_(expression, expression.output_name))
+            # The select list is replaced as a whole below, so the column can be wrapped in place.
+            expression = exp.alias_(expression, expression.output_name, copy=False)
 
         column = column or expression
         expression = expression.this
@@ -524,12 +545,49 @@ def text_diff(
     dialect: t.Optional[str] = None,
 ) -> str:
     """Find the unified text diff between two expressions."""
-    return "\n".join(
-        unified_diff(
-            a.sql(pretty=True, comments=False, dialect=dialect).split("\n") if a else "",
-            b.sql(pretty=True, comments=False, dialect=dialect).split("\n") if b else "",
-        )
-    )
+    a_lines = a.sql(pretty=True, comments=False, dialect=dialect).splitlines() if a else []
+    b_lines = b.sql(pretty=True, comments=False, dialect=dialect).splitlines() if b else []
+    return "\n".join(_unified_diff(a_lines, b_lines))
+
+
+def _unified_diff(a: t.List[str], b: t.List[str], n: int = 3) -> t.Iterator[str]:
+    """Produces the same output as difflib.unified_diff with default arguments.
+
+    Every distinct line is mapped to an integer id first, so that the sequence matcher compares
+    and hashes small integers instead of potentially long lines of SQL.
+    """
+    line_ids: t.Dict[str, int] = {}
+    a_ids = [line_ids.setdefault(line, len(line_ids)) for line in a]
+    b_ids = [line_ids.setdefault(line, len(line_ids)) for line in b]
+
+    started = False
+    for group in SequenceMatcher(None, a_ids, b_ids).get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield "--- \n"
+            yield "+++ \n"
+
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@\n"
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                yield from (f" {line}" for line in a[i1:i2])
+                continue
+            if tag in ("replace", "delete"):
+                yield from (f"-{line}" for line in a[i1:i2])
+            if tag in ("replace", "insert"):
+                yield from (f"+{line}" for line in b[j1:j2])
+
+
+def _format_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
 
 
 DIALECT_PATTERN = re.compile(
@@ -652,6 +710,25 @@ def parse(sql: str, default_dialect: t.Optional[str] = None) -> t.List[exp.Expre
     return expressions
 
 
+_MACRO_TRANSFORMS: t.Dict[t.Type[exp.Expression], t.Callable[..., str]] = {
+    Audit: lambda self, e: _sqlmesh_ddl_sql(self, e, "Audit"),
+    DColonCast: lambda self, e: f"{self.sql(e, 'this')}::{self.sql(e, 'to')}",
+    Jinja: lambda self, e: e.name,
+    JinjaQuery: lambda self, e: f"{JINJA_QUERY_BEGIN};\n{e.name}\n{JINJA_END};",
+    JinjaStatement: lambda self, e: f"{JINJA_STATEMENT_BEGIN};\n{e.name.strip()}\n{JINJA_END};",
+    MacroDef: lambda self, e: f"@DEF({self.sql(e.this)}, {self.sql(e.expression)})",
+    MacroFunc: _macro_func_sql,
+    MacroStrReplace: lambda self, e: f"@{self.sql(e.this)}",
+    MacroSQL: lambda self, e: f"@SQL({self.sql(e.this)})",
+    MacroVar: lambda self, e: f"@{e.name}",
+    Metric: lambda self, e: _sqlmesh_ddl_sql(self, e, "METRIC"),
+    Model: lambda self, e: _sqlmesh_ddl_sql(self, e, "MODEL"),
+    ModelKind: _model_kind_sql,
+    PythonCode: lambda self, e: self.expressions(e, sep="\n", indent=False),
+    StagedFilePath: lambda self, e: self.table_sql(e),
+}
+
+
 def extend_sqlglot() -> None:
     """Extend SQLGlot with SQLMesh's custom macro aware dialect."""
     tokenizers = {Tokenizer}
@@ -678,26 +755,7 @@ def extend_sqlglot() -> None:
 
     for generator in generators:
         if MacroFunc not in generator.TRANSFORMS:
-            generator.TRANSFORMS.update(
-                {
-                    Audit: lambda self, e: _sqlmesh_ddl_sql(self, e, "Audit"),
-                    DColonCast: lambda self, e: f"{self.sql(e, 'this')}::{self.sql(e, 'to')}",
-                    Jinja: lambda self, e: e.name,
-                    JinjaQuery: lambda self, e: f"{JINJA_QUERY_BEGIN};\n{e.name}\n{JINJA_END};",
-                    JinjaStatement: lambda self, e: f"{JINJA_STATEMENT_BEGIN};\n{e.name.strip()}\n{JINJA_END};",
-                    MacroDef: lambda self, e: f"@DEF({self.sql(e.this)}, {self.sql(e.expression)})",
-                    MacroFunc: _macro_func_sql,
-                    MacroStrReplace: lambda self, e: f"@{self.sql(e.this)}",
-                    MacroSQL: lambda self, e: f"@SQL({self.sql(e.this)})",
-                    MacroVar: lambda self, e: f"@{e.name}",
-                    Metric: lambda self, e: _sqlmesh_ddl_sql(self, e, "METRIC"),
-                    Model: lambda self, e: _sqlmesh_ddl_sql(self, e, "MODEL"),
-                    ModelKind: _model_kind_sql,
-                    PythonCode: lambda self, e: self.expressions(e, sep="\n", indent=False),
-                    StagedFilePath: lambda self, e: self.table_sql(e),
-                }
-            )
-
+            generator.TRANSFORMS.update(_MACRO_TRANSFORMS)
             generator.WITH_SEPARATED_COMMENTS = (*generator.WITH_SEPARATED_COMMENTS, Model)
 
     _override(Tokenizer, _scan_var)
@@ -753,11 +811,11 @@ def select_from_values_for_batch_range(
         exp.alias_(exp.cast(column, to=kind), column, copy=False)
         for column, kind in columns_to_types.items()
     ]
-    values_exp = exp.values(
-        [tuple(transform_values(v, columns_to_types)) for v in values[batch_start:batch_end]],
-        alias=alias,
-        columns=columns_to_types,
-    )
+    batch = values[batch_start:batch_end]
+    # Check the column types once per batch instead of once per value.
+    if any(kind == JSON_TYPE for kind in columns_to_types.values()):
+        batch = [tuple(transform_values(v, columns_to_types)) for v in batch]
+    values_exp = exp.values(batch, alias=alias, columns=columns_to_types)
     return exp.select(*casted_columns).from_(values_exp, copy=False)
 
 
@@ -802,6 +860,9 @@ def set_default_schema_and_catalog(
 
 
 def normalize_model_name(table: str | exp.Table | exp.Column, dialect: DialectType = None) -> str:
+    if isinstance(table, str):
+        return _normalize_model_name_str(table, dialect)
+
     if isinstance(table, exp.Column):
         table = exp.table_(*reversed(table.parts[:-1]))  # type: ignore
     else:
@@ -810,6 +871,15 @@ def normalize_model_name(table: str | exp.Table | exp.Column, dialect: DialectTy
     return exp.table_name(normalize_identifiers(table, dialect=dialect))
 
 
+@functools.lru_cache(maxsize=16384)
+def _normalize_model_name_str(table: str, dialect: DialectType) -> str:
+    # Names are normalized over and over again, e.g. for every dependency of every model, so
+    # parsing the same string repeatedly is avoided.
+    return exp.table_name(
+        normalize_identifiers(exp.to_table(table, dialect=dialect), dialect=dialect)
+    )
+
+
 def extract_columns_to_types(query: exp.Subqueryable) -> t.Dict[str, exp.DataType]:
     """Extract the column names and types from a query."""
     return {
@@ -33,7 +33,7 @@ from sqlmesh.core.dialect import (
 from sqlmesh.core.engine_adapter.shared import DataObject, set_catalog
 from sqlmesh.core.model.kind import TimeColumn
 from sqlmesh.core.schema_diff import SchemaDiffer
-from sqlmesh.utils import double_escape, random_id
+from sqlmesh.utils import double_escape, optional_import, random_id
 from sqlmesh.utils.connection_pool import create_connection_pool
 from sqlmesh.utils.date import TimeLike, make_inclusive, to_ts
 from sqlmesh.utils.errors import SQLMeshError, UnsupportedCatalogOperationError
@@ -52,6 +52,7 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+adbc_dbapi = optional_import("adbc_driver_manager.dbapi")
 
 MERGE_TARGET_ALIAS = "__MERGE_TARGET__"
 MERGE_SOURCE_ALIAS = "__MERGE_SOURCE__"
@@ -246,8 +247,10 @@ class EngineAdapter:
         target_table: TableName,
     ) -> t.List[SourceQuery]:
         assert isinstance(df, pd.DataFrame)
-        num_rows = len(df.index)
         batch_size = sys.maxsize if batch_size == 0 else batch_size
+        if adbc_dbapi and isinstance(self._connection_pool.get(), adbc_dbapi.Connection):
+            return self._df_to_arrow_source_queries(df, columns_to_types, batch_size, target_table)
+        num_rows = len(df.index)
         values = list(df.itertuples(index=False, name=None))
         return [
             SourceQuery(
@@ -262,6 +265,44 @@ class EngineAdapter:
             for i in range(0, num_rows, batch_size)
         ]
 
+    def _df_to_arrow_source_queries(
+        self,
+        df: pd.DataFrame,
+        columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+        target_table: TableName,
+    ) -> t.List[SourceQuery]:
+        """
+        ADBC connections can bulk load Arrow data directly, so the DataFrame is ingested into a
+        temp table instead of being rendered into VALUES expressions. The DataFrame is converted
+        one batch at a time so that only a single batch exists in both representations.
+        """
+        import pyarrow as pa
+
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        batches = (
+            pa.RecordBatch.from_pandas(
+                df.iloc[i : i + batch_size], schema=schema, preserve_index=False
+            )
+            for i in range(0, len(df.index), batch_size)
+        )
+
+        temp_table = self._get_temp_table(target_table)
+        self.cursor.adbc_ingest(
+            temp_table.name,
+            pa.RecordBatchReader.from_batches(schema, batches),
+            mode="create",
+            db_schema_name=temp_table.db or None,
+        )
+        return [
+            SourceQuery(
+                query_factory=lambda: exp.select(*self._casted_columns(columns_to_types)).from_(
+                    temp_table
+                ),
+                cleanup_func=lambda: self.drop_table(temp_table),
+            )
+        ]
+
     def _get_source_queries_and_columns_to_types(
         self,
         query_or_df: QueryOrDF,
@@ -1354,7 +1395,7 @@ class EngineAdapter:
                     if isinstance(e, exp.Expression)
                     else e
                 )
-                logger.debug(f"Executing SQL:\n{sql}")
+                logger.debug("Executing SQL:\n%s", sql)
                 self.cursor.execute(sql, **kwargs)
 
     @contextlib.contextmanager
@@ -517,7 +517,7 @@ class BigQueryEngineAdapter(InsertOverwriteWithMergeMixin):
                 if isinstance(e, exp.Expression)
                 else e
             )
-            logger.debug(f"Executing SQL:\n{sql}")
+            logger.debug("Executing SQL:\n%s", sql)
 
             # BigQuery's Python DB API implementation does not support retries, so we have to implement them ourselves.
             # So we update the cursor's query job and query data with the results of the new query job. This makes sure
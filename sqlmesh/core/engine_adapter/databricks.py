@@ -116,14 +116,15 @@ class DatabricksEngineAdapter(GetCurrentCatalogFromFunctionMixin, SparkEngineAda
         if self.is_spark_session_cursor:
             return super()._fetch_native_df(query, quote_identifiers=quote_identifiers)
         if self._use_spark_session:
-            logger.debug(f"Executing SQL:\n{query}")
+            logger.debug("Executing SQL:\n%s", query)
             return self.spark.sql(
                 self._to_sql(query, quote=quote_identifiers)
                 if isinstance(query, exp.Expression)
                 else query
             )
         self.execute(query)
-        return self.cursor.fetchall_arrow().to_pandas()
+        # Release the Arrow buffers as columns are converted to avoid holding both copies in memory
+        return self.cursor.fetchall_arrow().to_pandas(self_destruct=True, split_blocks=True)
 
     def fetchdf(
         self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
@@ -10,6 +10,7 @@ from sqlmesh.core.engine_adapter.mixins import (
     LogicalMergeMixin,
 )
 from sqlmesh.core.engine_adapter.shared import DataObject, DataObjectType, set_catalog
+from sqlmesh.utils import random_id
 
 if t.TYPE_CHECKING:
     from sqlmesh.core._typing import SchemaName, TableName
@@ -26,6 +27,34 @@ class DuckDBEngineAdapter(LogicalMergeMixin, GetCurrentCatalogFromFunctionMixin)
         """Sets the catalog name of the current connection."""
         self.execute(f"USE {catalog}")
 
+    def table_exists(self, table_name: TableName) -> bool:
+        """
+        Looks the table up in the information schema rather than relying on `DESCRIBE` to raise
+        when the table is missing. Unqualified parts resolve against the current database and
+        schema, and names are compared case-insensitively, like DuckDB's own resolution.
+        """
+        table = exp.to_table(table_name)
+
+        def lower(expression: exp.Expression) -> exp.Expression:
+            return exp.func("lower", expression)
+
+        sql = (
+            exp.select("1")
+            .from_("information_schema.tables")
+            .where(lower(exp.column("table_name")).eq(table.name.lower()))
+            .where(
+                lower(exp.column("table_schema")).eq(
+                    table.db.lower() if table.db else lower(exp.func("current_schema"))
+                )
+            )
+            .where(
+                lower(exp.column("table_catalog")).eq(
+                    table.catalog.lower() if table.catalog else lower(exp.func("current_database"))
+                )
+            )
+        )
+        return self.fetchone(sql) is not None
+
     def _df_to_source_queries(
         self,
         df: DF,
@@ -34,12 +63,19 @@ class DuckDBEngineAdapter(LogicalMergeMixin, GetCurrentCatalogFromFunctionMixin)
         target_table: TableName,
     ) -> t.List[SourceQuery]:
         temp_table = self._get_temp_table(target_table)
+        # Register the DataFrame explicitly rather than relying on DuckDB resolving the local
+        # variable, which breaks if a table with the same name exists in the catalog.
+        df_view = f"__sqlmesh_df_{random_id(short=True)}"
         temp_table_sql = (
             exp.select(*self._casted_columns(columns_to_types))
-            .from_("df")
+            .from_(df_view)
             .sql(dialect=self.dialect)
         )
-        self.cursor.sql(f"CREATE TABLE {temp_table} AS {temp_table_sql}")
+        self.cursor.register(df_view, df)
+        try:
+            self.cursor.sql(f"CREATE TABLE {temp_table} AS {temp_table_sql}")
+        finally:
+            self.cursor.unregister(df_view)
         return [
             SourceQuery(
                 query_factory=lambda: exp.select(*columns_to_types).from_(temp_table),  # type: ignore
@@ -152,7 +152,7 @@ class PandasNativeFetchDFSupportMixin(EngineAdapter):
             if isinstance(query, exp.Expression)
             else query
         )
-        logger.debug(f"Executing SQL:\n{sql}")
+        logger.debug("Executing SQL:\n%s", sql)
         return read_sql_query(sql, self._connection_pool.get())
 
 
@@ -1,22 +1,29 @@
 from __future__ import annotations
 
+import io
 import logging
 import typing as t
 
+import pandas as pd
 from sqlglot import exp
 
+from sqlmesh.core.engine_adapter.base import SourceQuery
 from sqlmesh.core.engine_adapter.base_postgres import BasePostgresEngineAdapter
 from sqlmesh.core.engine_adapter.mixins import (
     GetCurrentCatalogFromFunctionMixin,
     LogicalReplaceQueryMixin,
     PandasNativeFetchDFSupportMixin,
 )
+from sqlmesh.utils import optional_import
 
 if t.TYPE_CHECKING:
+    from sqlmesh.core._typing import TableName
     from sqlmesh.core.engine_adapter._typing import DF
 
 logger = logging.getLogger(__name__)
 
+psycopg2 = optional_import("psycopg2")
+
 
 class PostgresEngineAdapter(
     BasePostgresEngineAdapter,
@@ -40,3 +47,70 @@ class PostgresEngineAdapter(
         if not self._connection_pool.is_transaction_active:
             self._connection_pool.commit()
         return df
+
+    def _df_to_source_queries(
+        self,
+        df: DF,
+        columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+        target_table: TableName,
+    ) -> t.List[SourceQuery]:
+        """
+        psycopg2 cursors can stream data with `COPY ... FROM STDIN`, which avoids rendering and parsing
+        the DataFrame as VALUES expressions. The data is copied into a temp table that is then used as
+        the source query.
+        """
+        cursor = self.cursor
+        if not psycopg2 or not isinstance(cursor, psycopg2.extensions.cursor):
+            return super()._df_to_source_queries(df, columns_to_types, batch_size, target_table)
+
+        assert isinstance(df, pd.DataFrame)
+        # Nullable integer columns are stored as floats in pandas, which Postgres refuses to
+        # parse into integer columns.
+        df = df.astype(
+            {
+                column: "Int64"
+                for column, kind in zip(df.columns, columns_to_types.values())
+                if kind.is_type(*exp.DataType.INTEGER_TYPES)
+                and pd.api.types.is_float_dtype(df[column])
+            }
+        )
+        buffer = io.StringIO()
+        _write_csv(df, buffer)
+        buffer.seek(0)
+
+        temp_table = self._get_temp_table(target_table)
+        self.create_table(temp_table, columns_to_types)
+        columns = ", ".join(
+            exp.to_identifier(column).sql(dialect=self.dialect, identify=True)
+            for column in columns_to_types
+        )
+        copy_sql = f"COPY {self._to_sql(temp_table)} ({columns}) FROM STDIN WITH (FORMAT CSV)"
+        logger.debug("Executing SQL:\n%s", copy_sql)
+        cursor.copy_expert(copy_sql, buffer)
+
+        return [
+            SourceQuery(
+                query_factory=lambda: exp.select(*columns_to_types).from_(temp_table),  # type: ignore
+                cleanup_func=lambda: self.drop_table(temp_table),
+            )
+        ]
+
+
+def _write_csv(df: pd.DataFrame, buffer: t.TextIO) -> None:
+    """Writes the DataFrame as CSV where NULLs can't be confused with any value.
+
+    Postgres reads an unquoted empty field as NULL in CSV mode, so every non-null value is quoted
+    and NULLs are written as nothing at all. Empty strings then stay `""`.
+    """
+    if df.empty:
+        return
+
+    fields = []
+    for column in df.columns:
+        values = df[column]
+        field = '"' + values.astype(str).str.replace('"', '""', regex=False) + '"'
+        fields.append(field.mask(values.isna(), ""))
+
+    rows = fields[0].str.cat(fields[1:], sep=",") if len(fields) > 1 else fields[0]
+    buffer.write("\n".join(rows) + "\n")
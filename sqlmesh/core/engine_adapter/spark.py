@@ -415,6 +415,9 @@ class SparkEngineAdapter(HiveMetastoreTablePropertiesMixin):
         """
         pyspark_df = self.try_get_pyspark_df(query_or_df)
         if pyspark_df:
+            # Permanent views can't reference temporary ones so the data still has to be collected,
+            # but the types come from the Spark schema instead of being inferred from pandas.
+            columns_to_types = columns_to_types or self._columns_to_types(pyspark_df)
             query_or_df = pyspark_df.toPandas()
         super().create_view(
             view_name, query_or_df, columns_to_types, replace, materialized, **create_kwargs
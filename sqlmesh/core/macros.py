@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import sys
 import typing as t
 from enum import Enum
-from functools import reduce
+from functools import lru_cache, reduce
 from string import Template
 
 import sqlglot
@@ -42,17 +43,20 @@ class MacroStrTemplate(Template):
     delimiter = SQLMESH_MACRO_PREFIX
 
 
-EXPRESSIONS_NAME_MAP = {}
-
-for klass in sqlglot.Parser.EXPRESSION_PARSERS:
-    name = klass if isinstance(klass, str) else klass.__name__  # type: ignore
-    EXPRESSIONS_NAME_MAP[name.lower()] = name
+EXPRESSIONS_NAME_MAP = {
+    name.lower(): name
+    for name in (
+        klass if isinstance(klass, str) else klass.__name__  # type: ignore
+        for klass in sqlglot.Parser.EXPRESSION_PARSERS
+    )
+}
 
 
 def _macro_sql(sql: str, into: t.Optional[str] = None) -> str:
-    args = [_macro_str_replace(sql)]
-    if into in EXPRESSIONS_NAME_MAP:
-        args.append(f"into=exp.{EXPRESSIONS_NAME_MAP[into]}")
+    args = [sql]
+    name = EXPRESSIONS_NAME_MAP.get(into) if into else None
+    if name:
+        args.append(f"into=exp.{name}")
     return f"self.parse_one({', '.join(args)})"
 
 
@@ -74,6 +78,20 @@ def _macro_str_replace(text: str) -> str:
     return f"self.template({text}, locals())"
 
 
+def _macro_str_replace_sql(self: Generator, e: exp.Expression) -> str:
+    text = self.sql(e, "this")
+    if e.this.is_string and SQLMESH_MACRO_PREFIX not in e.this.name:
+        # String literals without macro variables don't need to be templated at runtime
+        return text
+    return _macro_str_replace(text)
+
+
+@lru_cache(maxsize=1024)
+def _compile(code: str) -> t.Any:
+    """Compiles the generated Python code of a macro so that repeated evaluations skip parsing."""
+    return compile(code, "<macro>", "eval")
+
+
 class MacroDialect(Python):
     class Generator(Python.Generator):
         TRANSFORMS = {
@@ -81,11 +99,26 @@ class MacroDialect(Python):
             exp.Column: lambda self, e: f"exp.to_column('{self.sql(e, 'this')}')",
             exp.Lambda: lambda self, e: f"lambda {self.expressions(e)}: {self.sql(e, 'this')}",
             MacroFunc: _macro_func_sql,
-            MacroSQL: lambda self, e: _macro_sql(self.sql(e, "this"), e.args.get("into")),
-            MacroStrReplace: lambda self, e: _macro_str_replace(self.sql(e, "this")),
+            MacroSQL: lambda self, e: _macro_sql(
+                _macro_str_replace_sql(self, e), e.args.get("into")
+            ),
+            MacroStrReplace: _macro_str_replace_sql,
         }
 
 
+def has_macros(expression: exp.Expression) -> bool:
+    """Returns whether the expression contains anything a MacroEvaluator would need to evaluate."""
+    return any(
+        isinstance(node, (MacroVar, MacroFunc)) or (node.is_string and has_jinja(node.this))
+        for node, *_ in expression.walk()
+    )
+
+
+# The dialect only holds configuration, so it is shared. Generators keep per-call state such as
+# unsupported_messages, so each evaluator creates its own.
+MACRO_DIALECT = MacroDialect()
+
+
 class MacroEvaluator:
     """The class responsible for evaluating SQLMesh Macros/SQL.
 
@@ -106,6 +139,19 @@ class MacroEvaluator:
         python_env: Serialized Python environment.
     """
 
+    __slots__ = (
+        "dialect",
+        "generator",
+        "locals",
+        "env",
+        "python_env",
+        "macros",
+        "columns_to_types_called",
+        "_jinja_env",
+        "_schema",
+        "_resolve_tables",
+    )
+
     def __init__(
         self,
         dialect: str = "",
@@ -116,12 +162,12 @@ class MacroEvaluator:
         resolve_tables: t.Optional[t.Callable[[exp.Expression], exp.Expression]] = None,
     ):
         self.dialect = dialect
-        self.generator = MacroDialect().generator()
+        self.generator = MACRO_DIALECT.generator()
         self.locals: t.Dict[str, t.Any] = {"runtime_stage": runtime_stage.value}
         self.env = {**ENV, "self": self}
         self.python_env = python_env or {}
         self._jinja_env: t.Optional[Environment] = jinja_env
-        self.macros = {normalize_macro_name(k): v.func for k, v in macro.get_registry().items()}
+        self.macros = _normalized_macros()
         self._schema = MappingSchema(schema, dialect=dialect, normalize=False) if schema else {}
         self._resolve_tables = resolve_tables
         self.columns_to_types_called = False
@@ -152,6 +198,10 @@ class MacroEvaluator:
     def transform(
         self, expression: exp.Expression
     ) -> exp.Expression | t.List[exp.Expression] | None:
+        if not has_macros(expression):
+            # Nothing to evaluate, but callers expect a copy they are free to mutate.
+            return expression.copy()
+
         changed = False
 
         def _transform_node(node: exp.Expression) -> exp.Expression:
@@ -177,17 +227,35 @@ class MacroEvaluator:
         expression = expression.transform(_transform_node)
 
         def evaluate_macros(
-            node: exp.Expression,
+            expression: exp.Expression,
         ) -> exp.Expression | t.List[exp.Expression] | None:
             nonlocal changed
 
-            exp.replace_children(
-                node, lambda n: n if isinstance(n, exp.Lambda) else evaluate_macros(n)
-            )
-            if isinstance(node, MacroFunc):
-                changed = True
-                return self.evaluate(node)
-            return node
+            # Post-order traversal with an explicit stack so that deeply nested queries don't
+            # exceed the recursion limit. Results are keyed by the id of the node they replace.
+            results: t.Dict[int, t.Any] = {}
+            stack: t.List[t.Tuple[exp.Expression, bool]] = [(expression, False)]
+
+            while stack:
+                node, visited = stack.pop()
+
+                if not visited:
+                    stack.append((node, True))
+                    stack.extend(
+                        (child, False)
+                        for _, child in reversed(list(node.iter_expressions()))
+                        if not isinstance(child, exp.Lambda)
+                    )
+                    continue
+
+                exp.replace_children(node, lambda n: results.pop(id(n), n))
+                if isinstance(node, MacroFunc):
+                    changed = True
+                    results[id(node)] = self.evaluate(node)
+                else:
+                    results[id(node)] = node
+
+            return results[id(expression)]
 
         transformed = evaluate_macros(expression)
 
@@ -211,7 +279,24 @@ class MacroEvaluator:
         Returns:
            The rendered string.
         """
-        return MacroStrTemplate(str(text)).safe_substitute(self.locals, **local_variables)
+        text = str(text)
+        if SQLMESH_MACRO_PREFIX not in text:
+            return text
+
+        def _substitute(match: t.Match[str]) -> str:
+            # Mirrors Template.safe_substitute without building a Template and a ChainMap per call.
+            name = match.group("named") or match.group("braced")
+            if name is not None:
+                if name in local_variables:
+                    return str(local_variables[name])
+                if name in self.locals:
+                    return str(self.locals[name])
+                return match.group()
+            if match.group("escaped") is not None:
+                return MacroStrTemplate.delimiter
+            return match.group()
+
+        return MacroStrTemplate.pattern.sub(_substitute, text)
 
     def evaluate(self, node: MacroFunc) -> exp.Expression | t.List[exp.Expression] | None:
         if isinstance(node, MacroDef):
@@ -245,12 +330,20 @@ class MacroEvaluator:
         """
         if not isinstance(node, exp.Expression):
             return node
-        code = node.sql()
+        # Boolean and NULL literals evaluate to constants, so skip code generation and eval
+        if isinstance(node, exp.Boolean):
+            return node.this
+        if isinstance(node, exp.Null):
+            return None
+
+        code = None
         try:
             code = self.generator.generate(node)
-            return eval(code, self.env, self.locals)
+            return eval(_compile(code), self.env, self.locals)
         except Exception as e:
             print_exception(e, self.python_env)
+            if code is None:
+                code = node.sql()
             raise MacroEvalError(
                 f"Error trying to eval macro.\n\nGenerated code: {code}\n\nOriginal sql: {node}"
             ) from e
@@ -394,14 +487,11 @@ def _norm_var_arg_lambda(
         expressions = items
 
     if not callable(func):
+        # The lambda's parameter names are the same for every item, so they're resolved only once
+        arg_names = [expression.name for expression in func.expressions]
         return expressions, lambda args: func.this.transform(
             substitute,
-            {
-                expression.name: arg
-                for expression, arg in zip(
-                    func.expressions, args.expressions if isinstance(args, exp.Tuple) else [args]
-                )
-            },
+            dict(zip(arg_names, args.expressions if isinstance(args, exp.Tuple) else [args])),
         )
 
     return expressions, func
@@ -515,6 +605,14 @@ def filter_(evaluator: MacroEvaluator, *args: t.Any) -> t.List[t.Any]:
     return list(filter(lambda arg: evaluator.eval_expression(func(arg)), items))
 
 
+E = t.TypeVar("E", bound=exp.Expression)
+
+
+def _insert_if(evaluator: MacroEvaluator, condition: exp.Condition, expression: E) -> t.Optional[E]:
+    """Shared implementation of the conditional insertion macros (WITH, JOIN, WHERE, etc)."""
+    return expression if evaluator.eval_expression(condition) else None
+
+
 @macro("WITH")
 def with_(
     evaluator: MacroEvaluator,
@@ -537,7 +635,7 @@ def with_(
     Returns:
         With expression if the conditional is True; otherwise None
     """
-    return expression if evaluator.eval_expression(condition) else None
+    return _insert_if(evaluator, condition, expression)
 
 
 @macro()
@@ -566,7 +664,7 @@ def join(
     Returns:
         Join expression if the conditional is True; otherwise None
     """
-    return expression if evaluator.eval_expression(condition) else None
+    return _insert_if(evaluator, condition, expression)
 
 
 @macro()
@@ -591,7 +689,7 @@ def where(
     Returns:
         Where expression if condition is True; otherwise None
     """
-    return expression if evaluator.eval_expression(condition) else None
+    return _insert_if(evaluator, condition, expression)
 
 
 @macro()
@@ -616,7 +714,7 @@ def group_by(
     Returns:
         Group expression if the condition is True; otherwise None
     """
-    return expression if evaluator.eval_expression(condition) else None
+    return _insert_if(evaluator, condition, expression)
 
 
 @macro()
@@ -641,7 +739,7 @@ def having(
     Returns:
         Having expression if the condition is True; otherwise None
     """
-    return expression if evaluator.eval_expression(condition) else None
+    return _insert_if(evaluator, condition, expression)
 
 
 @macro()
@@ -666,7 +764,7 @@ def order_by(
     Returns:
         Order expression if the condition is True; otherwise None
     """
-    return expression if evaluator.eval_expression(condition) else None
+    return _insert_if(evaluator, condition, expression)
 
 
 @macro("eval")
@@ -928,6 +1026,27 @@ def pivot(
     return aggregates
 
 
+@lru_cache(maxsize=None)
 def normalize_macro_name(name: str) -> str:
     """Prefix macro name with @ and upcase"""
-    return f"@{name.upper()}"
+    # Interned so that differently cased spellings share one key object for registry lookups
+    return sys.intern(f"@{name.upper()}")
+
+
+_NORMALIZED_MACROS: t.Tuple[t.Optional[UniqueKeyDict], int, t.Dict[str, t.Callable]] = (None, 0, {})
+
+
+def _normalized_macros() -> t.Dict[str, t.Callable]:
+    """Returns a copy of the registered macros keyed by their normalized names.
+
+    Registered macros can only be added, so the normalized mapping is rebuilt only when
+    the registry is replaced or grows.
+    """
+    global _NORMALIZED_MACROS
+
+    registry = macro.registry()
+    cached_registry, cached_size, normalized = _NORMALIZED_MACROS
+    if registry is not cached_registry or len(registry) != cached_size:
+        normalized = {normalize_macro_name(k): v.func for k, v in registry.items()}
+        _NORMALIZED_MACROS = (registry, len(registry), normalized)
+    return dict(normalized)
@@ -22,12 +22,18 @@ def parse_expression(
     if v is None:
         return None
 
+    # Already parsed expressions, e.g. when a model is copied or reconstructed, are passed through
+    if isinstance(v, exp.Expression):
+        return v
+
     if callable(v):
         return v
 
     dialect = values.get("dialect")
 
     if isinstance(v, list):
+        if all(isinstance(i, exp.Expression) for i in v):
+            return t.cast(t.List[exp.Expression], v)
         return [
             e
             for expressions in (
@@ -599,7 +599,7 @@ class _Model(ModelMeta, frozen=True):
 
     @property
     def view_name(self) -> str:
-        return exp.to_table(self.name).name
+        return self.fully_qualified_table.name
 
     @property
     def python_env(self) -> t.Dict[str, Executable]:
@@ -607,7 +607,7 @@ class _Model(ModelMeta, frozen=True):
 
     @property
     def schema_name(self) -> str:
-        return exp.to_table(self.name).db or c.DEFAULT_SCHEMA
+        return self.fully_qualified_table.db or c.DEFAULT_SCHEMA
 
     @property
     def physical_schema(self) -> str:
@@ -834,6 +834,7 @@ class _SqlBasedModel(_Model):
     )
 
     __statement_renderers: t.Dict[int, ExpressionRenderer] = {}
+    __macro_definitions: t.Optional[t.List[d.MacroDef]] = None
 
     _expression_validator = expression_validator
 
@@ -896,7 +897,11 @@ class _SqlBasedModel(_Model):
     @property
     def macro_definitions(self) -> t.List[d.MacroDef]:
         """All macro definitions from the list of expressions."""
-        return [s for s in self.pre_statements + self.post_statements if isinstance(s, d.MacroDef)]
+        if self.__macro_definitions is None:
+            self.__macro_definitions = [
+                s for s in self.pre_statements + self.post_statements if isinstance(s, d.MacroDef)
+            ]
+        return self.__macro_definitions
 
     def _render_statements(
         self,
@@ -998,13 +1003,15 @@ class SqlModel(_SqlBasedModel):
     @property
     def depends_on(self) -> t.Set[str]:
         if self._depends_on is None:
-            self._depends_on = self.depends_on_ or set()
+            # Copy so that the user-provided depends_on_ field is never mutated in place.
+            depends_on = set(self.depends_on_ or ())
 
             query = self.render_query(optimize=False)
             if query is not None:
-                self._depends_on |= d.find_tables(query, dialect=self.dialect)
+                depends_on |= d.find_tables(query, dialect=self.dialect)
 
-            self._depends_on -= {self.name}
+            depends_on.discard(self.name)
+            self._depends_on = depends_on
         return self._depends_on
 
     @property
@@ -1049,7 +1056,7 @@ class SqlModel(_SqlBasedModel):
             schema, default_schema=default_schema, default_catalog=default_catalog
         )
         self._columns_to_types = None
-        self._query_renderer._optimized_cache = {}
+        self._query_renderer._optimized_cache.clear()
 
     def validate_definition(self) -> None:
         query = self._query_renderer.render()
@@ -49,11 +49,7 @@ class ModelKindMixin:
 
     @property
     def is_incremental(self) -> bool:
-        return (
-            self.is_incremental_by_time_range
-            or self.is_incremental_by_unique_key
-            or self.is_incremental_unmanaged
-        )
+        return self.model_kind_name in _INCREMENTAL_KIND_NAMES
 
     @property
     def is_full(self) -> bool:
@@ -82,16 +78,16 @@ class ModelKindMixin:
     @property
     def is_symbolic(self) -> bool:
         """A symbolic model is one that doesn't execute at all."""
-        return self.model_kind_name in (ModelKindName.EMBEDDED, ModelKindName.EXTERNAL)
+        return self.model_kind_name in _SYMBOLIC_KIND_NAMES
 
     @property
     def is_materialized(self) -> bool:
-        return not (self.is_symbolic or self.is_view)
+        return self.model_kind_name not in _NON_MATERIALIZED_KIND_NAMES
 
     @property
     def only_execution_time(self) -> bool:
         """Whether or not this model only cares about execution time to render."""
-        return self.is_view or self.is_full or self.is_incremental_unmanaged or self.is_scd_type_2
+        return self.model_kind_name in _ONLY_EXECUTION_TIME_KIND_NAMES
 
 
 class ModelKindName(str, ModelKindMixin, Enum):
@@ -112,6 +108,26 @@ class ModelKindName(str, ModelKindMixin, Enum):
         return self
 
 
+# Composite kind checks resolve the kind name once and do a single set lookup.
+_INCREMENTAL_KIND_NAMES = frozenset(
+    {
+        ModelKindName.INCREMENTAL_BY_TIME_RANGE,
+        ModelKindName.INCREMENTAL_BY_UNIQUE_KEY,
+        ModelKindName.INCREMENTAL_UNMANAGED,
+    }
+)
+_SYMBOLIC_KIND_NAMES = frozenset({ModelKindName.EMBEDDED, ModelKindName.EXTERNAL})
+_NON_MATERIALIZED_KIND_NAMES = _SYMBOLIC_KIND_NAMES | {ModelKindName.VIEW}
+_ONLY_EXECUTION_TIME_KIND_NAMES = frozenset(
+    {
+        ModelKindName.VIEW,
+        ModelKindName.FULL,
+        ModelKindName.INCREMENTAL_UNMANAGED,
+        ModelKindName.SCD_TYPE_2,
+    }
+)
+
+
 _unique_key_validator = field_validator("unique_key", mode="before")(parse_expressions)
 
 
@@ -138,11 +154,11 @@ class TimeColumn(PydanticModel):
     def validator(cls) -> classmethod:
         def _time_column_validator(v: t.Any) -> TimeColumn:
             if isinstance(v, exp.Tuple):
-                kwargs = {
-                    key: v.expressions[i].name
-                    for i, key in enumerate(("column", "format")[: len(v.expressions)])
-                }
-                return TimeColumn(**kwargs)
+                expressions = v.expressions
+                if len(expressions) == 1:
+                    return TimeColumn(column=expressions[0].name)
+                if len(expressions) > 1:
+                    return TimeColumn(column=expressions[0].name, format=expressions[1].name)
 
             if isinstance(v, exp.Expression):
                 return TimeColumn(column=v.name)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+from functools import lru_cache
 
 from pydantic import Field
 from sqlglot import Dialect, exp
@@ -37,6 +38,13 @@ from sqlmesh.utils.pydantic import (
 AuditReference = t.Tuple[str, t.Dict[str, exp.Expression]]
 
 
+@lru_cache(maxsize=1024)
+def _build_data_type(data_type: str, dialect: t.Optional[str], udt: bool) -> exp.DataType:
+    # Wide tables repeat a handful of type strings, so each one is only parsed once. Callers
+    # must copy the result before using it.
+    return exp.DataType.build(data_type, dialect=dialect, udt=udt)
+
+
 class ModelMeta(_Node, extra="allow"):
     """Metadata for models which can be defined in SQL."""
 
@@ -61,6 +69,8 @@ class ModelMeta(_Node, extra="allow"):
     signals: t.List[exp.Tuple] = []
 
     _table_properties: t.Dict[str, exp.Expression] = {}
+    _partitioned_by: t.Optional[t.List[exp.Expression]] = None
+    _fully_qualified_table: t.Optional[exp.Table] = None
 
     _bool_validator = bool_validator
     _model_kind_validator = model_kind_validator
@@ -180,7 +190,10 @@ class ModelMeta(_Node, extra="allow"):
         if isinstance(v, dict):
             udt = Dialect.get_or_raise(dialect).SUPPORTS_USER_DEFINED_TYPES
             for k, data_type in v.items():
-                expr = exp.DataType.build(data_type, dialect=dialect, udt=udt)
+                if isinstance(data_type, str):
+                    expr = _build_data_type(data_type, dialect, udt).copy()
+                else:
+                    expr = exp.DataType.build(data_type, dialect=dialect, udt=udt)
                 expr.meta["dialect"] = dialect
                 columns_to_types[normalize_identifiers(k, dialect=dialect).name] = expr
 
@@ -313,11 +326,22 @@ class ModelMeta(_Node, extra="allow"):
 
     @property
     def partitioned_by(self) -> t.List[exp.Expression]:
-        if self.time_column and self.time_column.column not in [
-            col.name for col in self._partition_by_columns
-        ]:
-            return [*[exp.to_column(self.time_column.column)], *self.partitioned_by_]
-        return self.partitioned_by_
+        if self._partitioned_by is None:
+            time_column = self.time_column
+            if time_column and time_column.column not in {
+                col.name for col in self._partition_by_columns
+            }:
+                self._partitioned_by = [exp.to_column(time_column.column), *self.partitioned_by_]
+            else:
+                self._partitioned_by = self.partitioned_by_
+        return self._partitioned_by
+
+    @property
+    def fully_qualified_table(self) -> exp.Table:
+        """The model name parsed into a table expression. It's shared, so it must not be modified."""
+        if self._fully_qualified_table is None:
+            self._fully_qualified_table = exp.to_table(self.name)
+        return self._fully_qualified_table
 
     @property
     def column_descriptions(self) -> t.Dict[str, str]:
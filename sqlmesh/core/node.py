@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import typing as t
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 
 from pydantic import Field
 from sqlglot import exp
@@ -41,7 +42,11 @@ class IntervalUnit(str, Enum):
     QUARTER_HOUR = "quarter_hour"
     FIVE_MINUTE = "five_minute"
 
+    # The unit only depends on the cron expression, so every node with the same cron shares it.
+    # The cache is unbounded and keyed by the raw cron string (and sample size), so equivalent
+    # spellings such as "@daily" and "0 0 * * *" get separate entries.
     @classmethod
+    @lru_cache(maxsize=None)
     def from_cron(klass, cron: str, sample_size: int = DEFAULT_SAMPLE_SIZE) -> IntervalUnit:
         croniter = CroniterCache(cron)
         samples = [croniter.get_next() for _ in range(sample_size)]
@@ -106,7 +111,7 @@ class IntervalUnit(str, Enum):
         Returns:
             The timestamp for the next run.
         """
-        return self.croniter(value).get_next()
+        return self._shift(self._floor(to_datetime(value)), 1)
 
     def cron_prev(self, value: TimeLike) -> datetime:
         """
@@ -118,7 +123,9 @@ class IntervalUnit(str, Enum):
         Returns:
             The timestamp for the previous run.
         """
-        return self.croniter(value).get_prev()
+        value = to_datetime(value)
+        floor = self._floor(value)
+        return self._shift(floor, -1) if floor == value else floor
 
     def cron_floor(self, value: TimeLike) -> datetime:
         """
@@ -130,7 +137,33 @@ class IntervalUnit(str, Enum):
         Returns:
             The timestamp floor.
         """
-        return self.croniter(self.cron_next(value)).get_prev()
+        return self._floor(to_datetime(value))
+
+    def _floor(self, value: datetime) -> datetime:
+        # The cron expressions of interval units are all aligned to the start of their period,
+        # so the floor can be computed by truncating the timestamp instead of using croniter.
+        value = value.replace(second=0, microsecond=0)
+        if self.is_minute:
+            minutes = self.seconds // 60
+            return value.replace(minute=value.minute - value.minute % minutes)
+        value = value.replace(minute=0)
+        if self.is_hour:
+            return value
+        value = value.replace(hour=0)
+        if self.is_day:
+            return value
+        value = value.replace(day=1)
+        if self.is_month:
+            return value
+        return value.replace(month=1)
+
+    def _shift(self, value: datetime, periods: int) -> datetime:
+        if self.is_year:
+            return value.replace(year=value.year + periods)
+        if self.is_month:
+            month = value.month - 1 + periods
+            return value.replace(year=value.year + month // 12, month=month % 12 + 1)
+        return value + timedelta(seconds=self.seconds * periods)
 
     @property
     def seconds(self) -> int:
@@ -318,7 +351,9 @@ class _Node(PydanticModel):
         Returns:
             The timestamp floor.
         """
-        return self.croniter(self.cron_next(value)).get_prev()
+        croniter = self.croniter(value)
+        croniter.get_next()
+        return croniter.get_prev()
 
     def text_diff(self, other: Node) -> str:
         """Produce a text diff against another node.
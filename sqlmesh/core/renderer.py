@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
+import threading
 import typing as t
+from collections import OrderedDict
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -18,7 +20,7 @@ from sqlglot.schema import MappingSchema
 
 from sqlmesh.core import constants as c
 from sqlmesh.core import dialect as d
-from sqlmesh.core.macros import MacroEvaluator, RuntimeStage
+from sqlmesh.core.macros import MacroEvaluator, RuntimeStage, has_macros
 from sqlmesh.utils.date import TimeLike, date_dict, make_inclusive, to_datetime
 from sqlmesh.utils.errors import (
     ConfigError,
@@ -36,9 +38,60 @@ if t.TYPE_CHECKING:
 
 CacheKey = t.Tuple[datetime, datetime, datetime, RuntimeStage]
 
+# The maximum number of rendered intervals kept per renderer.
+RENDER_CACHE_SIZE = 128
+
 
 logger = logging.getLogger(__name__)
 
+V = t.TypeVar("V")
+
+
+class _RenderCache(t.Generic[V]):
+    """A thread-safe LRU cache of rendered results keyed by the rendering interval.
+
+    The same renderer can be used concurrently by the scheduler, e.g. when an embedded model is
+    expanded by several downstream models, so every access goes through a lock.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[CacheKey, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> t.Optional[V]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: CacheKey, value: V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > RENDER_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def keys(self) -> t.List[CacheKey]:
+        with self._lock:
+            return list(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        # Locks can't be pickled or deep copied, so only the entries are carried over.
+        with self._lock:
+            return {"_entries": OrderedDict(self._entries)}
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self._entries = state["_entries"]
+        self._lock = threading.Lock()
+
 
 class BaseExpressionRenderer:
     def __init__(
@@ -61,7 +114,8 @@ class BaseExpressionRenderer:
         self._only_execution_time = only_execution_time
         self.schema = {} if schema is None else schema
 
-        self._cache: t.Dict[CacheKey, t.List[exp.Expression]] = {}
+        self._cache: _RenderCache[t.List[exp.Expression]] = _RenderCache()
+        self._is_static: t.Optional[bool] = None
 
     def _render(
         self,
@@ -92,89 +146,107 @@ class BaseExpressionRenderer:
 
         cache_key = self._cache_key(start, end, execution_time, runtime_stage)
 
-        if cache_key not in self._cache:
-            expressions = [self._expression]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-            render_kwargs = {
-                **date_dict(
-                    cache_key[2],
-                    cache_key[0] if not self._only_execution_time else None,
-                    cache_key[1] if not self._only_execution_time else None,
-                ),
-                **kwargs,
-            }
+        if self.is_static:
+            with _normalize_and_quote(self._expression.copy(), self._dialect) as expression:
+                pass
+            self._cache.put(cache_key, [expression])
+            return [expression]
 
-            env = prepare_env(self._python_env)
-            jinja_env = self._jinja_macro_registry.build_environment(
-                **{**render_kwargs, **env},
-                snapshots=(snapshots or {}),
-                table_mapping=table_mapping,
-                deployability_index=deployability_index,
-            )
+        expressions = [self._expression]
 
-            if isinstance(self._expression, d.Jinja):
-                try:
-                    rendered_expression = jinja_env.from_string(self._expression.name).render()
-                    if not rendered_expression.strip():
-                        self._cache[cache_key] = []
-                        return []
-
-                    parsed_expressions = [
-                        e for e in parse(rendered_expression, read=self._dialect) if e
-                    ]
-                    if not parsed_expressions:
-                        raise ConfigError(f"Failed to parse an expression {self._expression}")
-                    expressions = parsed_expressions
-                except ParsetimeAdapterCallError:
-                    raise
-                except Exception as ex:
-                    raise ConfigError(f"Invalid expression. {ex} at '{self._path}'") from ex
-
-            macro_evaluator = MacroEvaluator(
-                self._dialect,
-                python_env=self._python_env,
-                jinja_env=jinja_env,
-                schema=self.schema,
-                runtime_stage=runtime_stage,
-                resolve_tables=lambda e: self._resolve_tables(
-                    e,
-                    snapshots=snapshots,
-                    table_mapping=table_mapping,
-                    deployability_index=deployability_index,
-                    start=start,
-                    end=end,
-                    execution_time=execution_time,
-                ),
-            )
-
-            for definition in self._macro_definitions:
-                try:
-                    macro_evaluator.evaluate(definition)
-                except MacroEvalError as ex:
-                    raise_config_error(f"Failed to evaluate macro '{definition}'. {ex}", self._path)
+        render_kwargs = {
+            **date_dict(
+                cache_key[2],
+                cache_key[0] if not self._only_execution_time else None,
+                cache_key[1] if not self._only_execution_time else None,
+            ),
+            **kwargs,
+        }
 
-            macro_evaluator.locals.update(render_kwargs)
+        env = prepare_env(self._python_env)
+        jinja_env = self._jinja_macro_registry.build_environment(
+            **{**render_kwargs, **env},
+            snapshots=(snapshots or {}),
+            table_mapping=table_mapping,
+            deployability_index=deployability_index,
+        )
 
-            resolved_expressions: t.List[exp.Expression] = []
-            for expression in expressions:
-                try:
-                    expression = macro_evaluator.transform(expression)  # type: ignore
-                except MacroEvalError as ex:
-                    raise_config_error(f"Failed to resolve macro for expression. {ex}", self._path)
+        if isinstance(self._expression, d.Jinja):
+            try:
+                rendered_expression = jinja_env.from_string(self._expression.name).render()
+                if not rendered_expression.strip():
+                    self._cache.put(cache_key, [])
+                    return []
+
+                parsed_expressions = [
+                    e for e in parse(rendered_expression, read=self._dialect) if e
+                ]
+                if not parsed_expressions:
+                    raise ConfigError(f"Failed to parse an expression {self._expression}")
+                expressions = parsed_expressions
+            except ParsetimeAdapterCallError:
+                raise
+            except Exception as ex:
+                raise ConfigError(f"Invalid expression. {ex} at '{self._path}'") from ex
+
+        macro_evaluator = MacroEvaluator(
+            self._dialect,
+            python_env=self._python_env,
+            jinja_env=jinja_env,
+            schema=self.schema,
+            runtime_stage=runtime_stage,
+            resolve_tables=lambda e: self._resolve_tables(
+                e,
+                snapshots=snapshots,
+                table_mapping=table_mapping,
+                deployability_index=deployability_index,
+                start=start,
+                end=end,
+                execution_time=execution_time,
+            ),
+        )
 
-                if expression:
-                    with _normalize_and_quote(expression, self._dialect) as expression:
-                        pass
-                    resolved_expressions.append(expression)
+        for definition in self._macro_definitions:
+            try:
+                macro_evaluator.evaluate(definition)
+            except MacroEvalError as ex:
+                raise_config_error(f"Failed to evaluate macro '{definition}'. {ex}", self._path)
 
-            # We dont cache here if columns_to_type was called in a macro.
-            # This allows the model's query to be re-rendered so that the
-            # MacroEvaluator can resolve columns_to_types calls and provide true schemas.
-            if not macro_evaluator.columns_to_types_called:
-                self._cache[cache_key] = resolved_expressions
-            return resolved_expressions
+        macro_evaluator.locals.update(render_kwargs)
 
-        return self._cache[cache_key]
+        resolved_expressions: t.List[exp.Expression] = []
+        for expression in expressions:
+            try:
+                expression = macro_evaluator.transform(expression)  # type: ignore
+            except MacroEvalError as ex:
+                raise_config_error(f"Failed to resolve macro for expression. {ex}", self._path)
+
+            if expression:
+                with _normalize_and_quote(expression, self._dialect) as expression:
+                    pass
+                resolved_expressions.append(expression)
+
+        # We dont cache here if columns_to_type was called in a macro.
+        # This allows the model's query to be re-rendered so that the
+        # MacroEvaluator can resolve columns_to_types calls and provide true schemas.
+        if not macro_evaluator.columns_to_types_called:
+            self._cache.put(cache_key, resolved_expressions)
+        return resolved_expressions
+
+    @property
+    def is_static(self) -> bool:
+        """Whether the expression has no macros or jinja to evaluate, so rendering is just a copy."""
+        if self._is_static is None:
+            self._is_static = (
+                not isinstance(self._expression, d.Jinja)
+                and not self._macro_definitions
+                and not has_macros(self._expression)
+            )
+        return self._is_static
 
     def update_cache(
         self,
@@ -184,7 +256,7 @@ class BaseExpressionRenderer:
         execution_time: t.Optional[TimeLike] = None,
         **kwargs: t.Any,
     ) -> None:
-        self._cache[self._cache_key(start, end, execution_time)] = [expression]
+        self._cache.put(self._cache_key(start, end, execution_time), [expression])
 
     def _resolve_tables(
         self,
@@ -208,43 +280,52 @@ class BaseExpressionRenderer:
         with _normalize_and_quote(expression, self._dialect) as expression:
             snapshots = snapshots or {}
             table_mapping = table_mapping or {}
-            mapping = {**to_table_mapping(snapshots.values(), deployability_index), **table_mapping}
             expand = {d.normalize_model_name(name, dialect=self._dialect) for name in expand} | {
                 name for name, snapshot in snapshots.items() if snapshot.is_embedded
             }
 
-            if expand:
-
-                def _expand(node: exp.Expression) -> exp.Expression:
-                    if isinstance(node, exp.Table) and snapshots:
-                        name = exp.table_name(node)
-                        model = snapshots[name].model if name in snapshots else None
-                        if (
-                            name in expand
-                            and model
-                            and not model.is_seed
-                            and not model.kind.is_external
-                        ):
-                            nested_query = model.render_query(
-                                start=start,
-                                end=end,
-                                execution_time=execution_time,
-                                snapshots=snapshots,
-                                table_mapping=table_mapping,
-                                expand=expand,
-                                deployability_index=deployability_index,
-                                **kwargs,
-                            )
-                            if nested_query is not None:
-                                return nested_query.subquery(
-                                    alias=node.alias or model.view_name,
-                                    copy=False,
-                                )
-                            else:
-                                logger.warning("Failed to expand the nested model '%s'", name)
-                    return node
-
-                expression = expression.transform(_expand, copy=False)
+            if expand and snapshots:
+                # Only table nodes can be expanded, so visit those rather than every node in the tree.
+                for table in list(expression.find_all(exp.Table)):
+                    name = exp.table_name(table)
+                    if name not in expand or name not in snapshots:
+                        continue
+
+                    model = snapshots[name].model
+                    if not model or model.is_seed or model.kind.is_external:
+                        continue
+
+                    nested_query = model.render_query(
+                        start=start,
+                        end=end,
+                        execution_time=execution_time,
+                        snapshots=snapshots,
+                        table_mapping=table_mapping,
+                        expand=expand,
+                        deployability_index=deployability_index,
+                        **kwargs,
+                    )
+                    if nested_query is None:
+                        logger.warning("Failed to expand the nested model '%s'", name)
+                        continue
+
+                    subquery = nested_query.subquery(
+                        alias=table.alias or model.view_name, copy=False
+                    )
+                    if table is expression:
+                        expression = subquery  # type: ignore
+                    else:
+                        table.replace(subquery)
+
+            # Only snapshots referenced by the expression need their physical table names computed.
+            referenced = {exp.table_name(table) for table in expression.find_all(exp.Table)}
+            mapping = {
+                **to_table_mapping(
+                    (snapshots[name] for name in referenced if name in snapshots),
+                    deployability_index,
+                ),
+                **table_mapping,
+            }
 
             if mapping:
                 expression = exp.replace_tables(expression, mapping, copy=False)
@@ -328,7 +409,7 @@ class QueryRenderer(BaseExpressionRenderer):
 
         self._model_name = model_name
 
-        self._optimized_cache: t.Dict[CacheKey, exp.Expression] = {}
+        self._optimized_cache: _RenderCache[exp.Expression] = _RenderCache()
 
     def render(
         self,
@@ -365,7 +446,13 @@ class QueryRenderer(BaseExpressionRenderer):
         """
         cache_key = self._cache_key(start, end, execution_time, runtime_stage)
 
-        if not optimize or cache_key not in self._optimized_cache:
+        query = (
+            t.cast(t.Optional[exp.Subqueryable], self._optimized_cache.get(cache_key))
+            if optimize
+            else None
+        )
+
+        if query is None:
             try:
                 expressions = super()._render(
                     start=start,
@@ -390,9 +477,7 @@ class QueryRenderer(BaseExpressionRenderer):
 
             if optimize:
                 query = self._optimize_query(query)
-                self._optimized_cache[cache_key] = query
-        else:
-            query = t.cast(exp.Subqueryable, self._optimized_cache[cache_key])
+                self._optimized_cache.put(cache_key, query)
 
         # Table resolution MUST happen after optimization, otherwise the schema won't match the table names.
         query = self._resolve_tables(
@@ -426,7 +511,7 @@ class QueryRenderer(BaseExpressionRenderer):
                 expression, start=start, end=end, execution_time=execution_time, **kwargs
             )
         else:
-            self._optimized_cache[self._cache_key(start, end, execution_time)] = expression
+            self._optimized_cache.put(self._cache_key(start, end, execution_time), expression)
 
     def _optimize_query(self, query: exp.Subqueryable) -> exp.Subqueryable:
         # We don't want to normalize names in the schema because that's handled by the optimizer
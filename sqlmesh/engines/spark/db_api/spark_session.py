@@ -84,6 +84,8 @@ class SparkSessionConnection:
         self.spark.conf.set("spark.sql.sources.partitionOverwriteMode", "dynamic")
         self.spark.conf.set("hive.exec.dynamic.partition", "true")
         self.spark.conf.set("hive.exec.dynamic.partition.mode", "nonstrict")
+        # Convert pandas DataFrames with Arrow instead of pickling them row by row
+        self.spark.conf.set("spark.sql.execution.arrow.pyspark.enabled", "true")
         return SparkSessionCursor(self.spark)
 
     def commit(self) -> None:
@@ -16,6 +16,7 @@ class CroniterCache:
         self.cron = cron
         self.curr: datetime = to_datetime(now() if time is None else time)
         self._interval_seconds: t.Optional[int] = None
+        self._croniter: t.Optional[croniter] = None
 
     @property
     def interval_seconds(self) -> int:
@@ -32,7 +33,7 @@ class CroniterCache:
 
             for _ in range(self.ESTIMATE_SAMPLES_NUM):
                 prev = curr
-                curr = to_datetime(croniter(self.cron, curr).get_next() * 1000)
+                curr = self._croniter_at(curr).get_next(datetime)
                 deltas.add(curr - prev)
 
             if len(deltas) == 1:
@@ -46,12 +47,21 @@ class CroniterCache:
         if estimate and self.interval_seconds:
             self.curr = self.curr + timedelta(seconds=self.interval_seconds)
         else:
-            self.curr = to_datetime(croniter(self.cron, self.curr).get_next() * 1000)
+            self.curr = self._croniter_at(self.curr).get_next(datetime)
         return self.curr
 
     def get_prev(self, estimate: bool = False) -> datetime:
         if estimate and self.interval_seconds:
             self.curr = self.curr - timedelta(seconds=self.interval_seconds)
         else:
-            self.curr = to_datetime(croniter(self.cron, self.curr).get_prev() * 1000)
+            self.curr = self._croniter_at(self.curr).get_prev(datetime)
         return self.curr
+
+    def _croniter_at(self, time: datetime) -> croniter:
+        # Expanding the cron expression dominates the cost of creating a croniter, so a single
+        # instance is reused and only its current time is moved.
+        if self._croniter is None:
+            self._croniter = croniter(self.cron, time)
+        else:
+            self._croniter.set_current(time)
+        return self._croniter
@@ -12,6 +12,7 @@ import textwrap
 import types
 import typing as t
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 from astor import to_source
@@ -403,12 +404,19 @@ def prepare_env(
         if executable.is_value:
             env[name] = ast.literal_eval(executable.payload)
         else:
-            exec(executable.payload, env)
+            exec(_compile_payload(executable.payload), env)
             if executable.alias and executable.name:
                 env[executable.alias] = env[executable.name]
     return env
 
 
+@lru_cache(maxsize=1024)
+def _compile_payload(payload: str) -> types.CodeType:
+    # Environments are prepared on every render, so compile each payload only once. The "<string>"
+    # filename matches what exec uses for source strings and is relied upon by print_exception.
+    return compile(payload, "<string>", "exec")
+
+
 def print_exception(
     exception: Exception,
     python_env: t.Dict[str, Executable],
@@ -122,6 +122,15 @@ class PydanticModel(pydantic.BaseModel):
             super().model_copy(**kwargs) if PYDANTIC_MAJOR_VERSION >= 2 else super().copy(**kwargs)  # type: ignore
         )
 
+    @classmethod  # type: ignore
+    def construct(
+        cls: t.Type["Model"], _fields_set: t.Optional[t.Set[str]] = None, **values: t.Any
+    ) -> "Model":
+        """Creates a model instance without validating the provided values."""
+        return (
+            super().model_construct(_fields_set, **values) if PYDANTIC_MAJOR_VERSION >= 2 else super().construct(_fields_set, **values)  # type: ignore
+        )
+
     @property
     def fields_set(self: "Model") -> t.Set[str]:
         return self.__pydantic_fields_set__ if PYDANTIC_MAJOR_VERSION >= 2 else self.__fields_set__  # type: ignore
@@ -335,6 +335,43 @@ def test_insert_append_pandas_batches(make_mocked_engine_adapter: t.Callable):
     ]
 
 
+def test_insert_append_pandas_adbc(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture, make_temp_table_name: t.Callable
+):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.base.adbc_dbapi",
+        mocker.Mock(Connection=type(adapter._connection_pool.get())),
+    )
+    temp_table_mock = mocker.patch("sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table")
+    temp_table_mock.return_value = make_temp_table_name("test_schema.test_table", "abcd")
+    adapter.DEFAULT_BATCH_SIZE = 2
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    adapter.insert_append(
+        "test_schema.test_table",
+        df,
+        columns_to_types={
+            "a": exp.DataType.build("INT"),
+            "b": exp.DataType.build("INT"),
+        },
+    )
+
+    args, kwargs = adapter.cursor.adbc_ingest.call_args
+    assert args[0] == "__temp_test_table_abcd"
+    batches = list(args[1])
+    assert [batch.to_pydict() for batch in batches] == [
+        {"a": [1, 2], "b": [4, 5]},
+        {"a": [3], "b": [6]},
+    ]
+    assert kwargs == {"mode": "create", "db_schema_name": "test_schema"}
+
+    assert to_sql_calls(adapter) == [
+        'INSERT INTO "test_schema"."test_table" ("a", "b") SELECT CAST("a" AS INT) AS "a", CAST("b" AS INT) AS "b" FROM "test_schema"."__temp_test_table_abcd"',
+        'DROP TABLE IF EXISTS "test_schema"."__temp_test_table_abcd"',
+    ]
+
+
 def test_create_table(make_mocked_engine_adapter: t.Callable):
     adapter = make_mocked_engine_adapter(EngineAdapter)
 
@@ -33,6 +33,39 @@ def test_create_schema(adapter: EngineAdapter, duck_conn):
 def test_table_exists(adapter: EngineAdapter, duck_conn):
     assert not adapter.table_exists("test_table")
     assert adapter.table_exists("tbl")
+    assert adapter.table_exists("main.tbl")
+    assert not adapter.table_exists("test_schema.tbl")
+
+    duck_conn.execute("CREATE SCHEMA test_schema")
+    duck_conn.execute("CREATE TABLE test_schema.test_table AS SELECT 1 AS a")
+    assert adapter.table_exists("test_schema.test_table")
+    assert adapter.table_exists("memory.test_schema.test_table")
+    assert not adapter.table_exists("test_table")
+    assert not adapter.table_exists("other_catalog.test_schema.test_table")
+
+
+def test_table_exists_case_insensitive(adapter: EngineAdapter, duck_conn):
+    duck_conn.execute("CREATE TABLE MixedCase AS SELECT 1 AS a")
+    assert adapter.table_exists("mixedcase")
+    assert adapter.table_exists("MIXEDCASE")
+    assert adapter.table_exists("Main.MixedCase")
+
+
+def test_table_exists_attached_catalog(adapter: EngineAdapter, duck_conn):
+    duck_conn.execute("ATTACH ':memory:' AS other_catalog")
+    duck_conn.execute("CREATE SCHEMA other_catalog.s")
+    duck_conn.execute("CREATE TABLE other_catalog.s.t AS SELECT 1 AS a")
+
+    assert adapter.table_exists("other_catalog.s.t")
+    assert not adapter.table_exists("s.t")
+
+    adapter.execute("USE other_catalog.s")
+    try:
+        assert adapter.table_exists("t")
+        assert adapter.table_exists("s.t")
+        assert not adapter.table_exists("tbl")
+    finally:
+        adapter.execute("USE memory.main")
 
 
 def test_create_table(adapter: EngineAdapter, duck_conn):
@@ -61,3 +94,15 @@ def test_replace_query_pandas(adapter: EngineAdapter, duck_conn):
         "test_table", df, {"a": exp.DataType.build("long"), "b": exp.DataType.build("long")}
     )
     pd.testing.assert_frame_equal(adapter.fetchdf("SELECT * FROM test_table"), df)
+
+
+def test_replace_query_pandas_name_conflict(adapter: EngineAdapter, duck_conn):
+    duck_conn.execute("CREATE TABLE df AS SELECT 7 AS a, 8 AS b")
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    adapter.replace_query(
+        "test_table", df, {"a": exp.DataType.build("long"), "b": exp.DataType.build("long")}
+    )
+    pd.testing.assert_frame_equal(adapter.fetchdf("SELECT * FROM test_table"), df)
+    assert duck_conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name LIKE '__sqlmesh_df_%'"
+    ).fetchone() == (0,)
@@ -595,6 +595,27 @@ def test_insert_append(ctx: TestContext):
         ctx.compare_with_current(table, pd.concat([input_data, append_data]))
 
 
+def test_insert_append_pandas_null_strings(ctx: TestContext):
+    if ctx.dialect != "postgres" or ctx.test_type != "df":
+        pytest.skip("Only the Postgres adapter loads DataFrames through a CSV COPY")
+
+    ctx.init()
+    table = ctx.table("test_table")
+    columns_to_types = {"id": exp.DataType.build("int"), "value": exp.DataType.build("text")}
+    ctx.engine_adapter.create_table(table, columns_to_types)
+    ctx.engine_adapter.insert_append(
+        table,
+        pd.DataFrame({"id": [1, 2, 3], "value": ["\\N", "", None]}),
+        columns_to_types=columns_to_types,
+    )
+
+    assert ctx.engine_adapter.fetchall(exp.select("id", "value").from_(table).order_by("id")) == [
+        (1, "\\N"),
+        (2, ""),
+        (3, None),
+    ]
+
+
 def test_insert_overwrite_by_time_partition(ctx: TestContext):
     ds_type = "string"
     if ctx.dialect == "bigquery":
@@ -1,7 +1,9 @@
 import typing as t
 
+import pandas as pd
 import pytest
 from pytest_mock import MockFixture
+from sqlglot import exp
 from sqlglot.helper import ensure_list
 
 from sqlmesh.core.engine_adapter import PostgresEngineAdapter
@@ -57,3 +59,39 @@ def test_drop_schema_with_catalog(make_mocked_engine_adapter: t.Callable, mocker
 
     with pytest.raises(UnsupportedCatalogOperationError):
         adapter.drop_schema("test_catalog.test_schema")
+
+
+def test_insert_append_pandas_copy(
+    make_mocked_engine_adapter: t.Callable, mocker: MockFixture, make_temp_table_name: t.Callable
+):
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    mocker.patch(
+        "sqlmesh.core.engine_adapter.postgres.psycopg2",
+        mocker.Mock(extensions=mocker.Mock(cursor=type(adapter.cursor))),
+    )
+    temp_table_mock = mocker.patch("sqlmesh.core.engine_adapter.EngineAdapter._get_temp_table")
+    temp_table_mock.return_value = make_temp_table_name("test_schema.test_table", "abcd")
+
+    df = pd.DataFrame({"a": [1, None, 3, 4], "b": ["x", "", None, "\\N"]})
+    adapter.insert_append(
+        "test_schema.test_table",
+        df,
+        columns_to_types={
+            "a": exp.DataType.build("INT"),
+            "b": exp.DataType.build("TEXT"),
+        },
+    )
+
+    copy_sql, buffer = adapter.cursor.copy_expert.call_args[0]
+    assert (
+        copy_sql
+        == """COPY "test_schema"."__temp_test_table_abcd" ("a", "b") FROM STDIN WITH (FORMAT CSV)"""
+    )
+    # Postgres reads only unquoted empty fields as NULL, so empty strings and "\N" survive.
+    assert buffer.getvalue() == '"1","x"\n,""\n"3",\n"4","\\N"\n'
+
+    assert to_sql_calls(adapter) == [
+        'CREATE TABLE IF NOT EXISTS "test_schema"."__temp_test_table_abcd" ("a" INT, "b" TEXT)',
+        'INSERT INTO "test_schema"."test_table" ("a", "b") SELECT "a", "b" FROM "test_schema"."__temp_test_table_abcd"',
+        'DROP TABLE IF EXISTS "test_schema"."__temp_test_table_abcd"',
+    ]
@@ -1,9 +1,12 @@
+from difflib import unified_diff
+
 from sqlglot import exp, parse_one
 
 from sqlmesh.core.dialect import (
     JinjaQuery,
     JinjaStatement,
     Model,
+    extend_sqlglot,
     format_model_expressions,
     parse,
     select_from_values_for_batch_range,
@@ -138,6 +141,16 @@ FROM foo
     )
 
 
+def test_keyword_macros_with_keyword_literals():
+    for sql in (
+        "SELECT 'WHERE' AS w FROM x @WHERE(TRUE) y = 'WHERE'",
+        "SELECT 1 FROM x LEFT @JOIN(TRUE) y ON x.a = 'JOIN'",
+        "@WITH(TRUE) x AS (SELECT 'WITH') SELECT 1 FROM x @GROUP_BY(TRUE) 'GROUP BY'",
+        "SELECT 1 FROM x @HAVING(TRUE) 'HAVING' = a @ORDER_BY(TRUE) 'ORDER BY'",
+    ):
+        assert parse_one(sql).sql() == sql
+
+
 def test_text_diff():
     assert """@@ -1,3 +1,3 @@
 
@@ -150,6 +163,21 @@ def test_text_diff():
     )
 
 
+def test_text_diff_matches_unified_diff():
+    a = parse_one("SELECT a, b, c, d, e, f, g, h FROM x WHERE a > 1 AND b < 2")
+    b = parse_one("SELECT a, c, d, e, f, g, h, i FROM y WHERE a > 1 AND b < 3")
+
+    expected = "\n".join(
+        unified_diff(
+            a.sql(pretty=True, comments=False).split("\n"),
+            b.sql(pretty=True, comments=False).split("\n"),
+        )
+    )
+    assert text_diff(a, b) == expected
+    assert text_diff(a, a) == ""
+    assert text_diff(None, b).startswith("--- \n\n+++ \n\n@@ -0,0 +1,12 @@")
+
+
 def test_parse():
     expressions = parse(
         """
@@ -208,6 +236,17 @@ def test_parse_jinja_with_semicolons():
     assert isinstance(expressions[4], exp.Drop)
 
 
+def test_extend_sqlglot_idempotent():
+    extend_sqlglot()
+    extend_sqlglot()
+
+    assert (
+        parse_one("SELECT 1 FROM x @WHERE(TRUE) y = 1").sql()
+        == "SELECT 1 FROM x @WHERE(TRUE) y = 1"
+    )
+    assert isinstance(parse("MODEL (name a); SELECT 1")[0], Model)
+
+
 def test_seed():
     expressions = parse(
         """
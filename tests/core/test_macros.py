@@ -40,6 +40,26 @@ def test_case():
     assert macro.get_registry()["upper"]
 
 
+def test_macro_registry_changes():
+    standard_macros = macro.get_registry()
+    evaluator = MacroEvaluator()
+    assert "@LATE_MACRO" not in evaluator.macros
+
+    evaluator.macros["@LOCAL_MACRO"] = noop
+    assert "@LOCAL_MACRO" not in MacroEvaluator().macros
+
+    @macro()
+    def late_macro(evaluator: MacroEvaluator) -> str:
+        return "late"
+
+    try:
+        assert "@LATE_MACRO" in MacroEvaluator().macros
+    finally:
+        macro.set_registry(standard_macros)
+
+    assert "@LATE_MACRO" not in MacroEvaluator().macros
+
+
 def test_external_macro() -> None:
     def foo(evaluator: MacroEvaluator) -> str:
         return "foo"
@@ -66,6 +86,12 @@ def test_external_macro() -> None:
         assert evaluator.macros["@FOO"](evaluator) == "foo"
 
 
+def test_template(macro_evaluator):
+    macro_evaluator.locals = {"x": 1, "y": "b"}
+    assert macro_evaluator.template("@x @{y}_c @z @@x @", {}) == "1 b_c @z @x @"
+    assert macro_evaluator.template("@x @y", {"x": "a"}) == "a b"
+
+
 def test_macro_var(macro_evaluator):
     expression = parse_one("@x")
     for k, v in [
@@ -116,6 +142,20 @@ def test_ast_correctness(macro_evaluator):
     ) == exp.table_("y")
 
 
+def test_eval_expression_literals(macro_evaluator):
+    assert macro_evaluator.eval_expression(exp.true()) is True
+    assert macro_evaluator.eval_expression(exp.false()) is False
+    assert macro_evaluator.eval_expression(exp.null()) is None
+    assert macro_evaluator.eval_expression(parse_one("1 + 1")) == 2
+
+
+def test_transform_no_macros(macro_evaluator):
+    expression = parse_one("SELECT a, 'b' AS c FROM x")
+    transformed = macro_evaluator.transform(expression)
+    assert transformed == expression
+    assert transformed is not expression
+
+
 @pytest.mark.parametrize(
     "sql, expected, args",
     [
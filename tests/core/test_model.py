@@ -1,4 +1,9 @@
 import logging
+import pickle
+import sys
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from datetime import date
 from pathlib import Path
 from unittest.mock import patch
@@ -13,7 +18,7 @@ from sqlmesh.core.config import Config
 from sqlmesh.core.config.model import ModelDefaultsConfig
 from sqlmesh.core.context import Context
 from sqlmesh.core.dialect import parse
-from sqlmesh.core.macros import MacroEvaluator, macro
+from sqlmesh.core.macros import MacroEvaluator, RuntimeStage, macro
 from sqlmesh.core.model import (
     IncrementalByTimeRangeKind,
     IncrementalUnmanagedKind,
@@ -31,6 +36,7 @@ from sqlmesh.core.model import (
 from sqlmesh.core.model.common import parse_expression
 from sqlmesh.core.model.seed import CsvSettings
 from sqlmesh.core.node import IntervalUnit, _Node
+from sqlmesh.core.renderer import _RenderCache
 from sqlmesh.core.snapshot import SnapshotChangeCategory
 from sqlmesh.utils.date import to_datetime, to_timestamp
 from sqlmesh.utils.errors import ConfigError
@@ -1621,6 +1627,96 @@ def test_model_cache(tmp_path: Path, mocker: MockerFixture):
     assert loader.call_count == 3
 
 
+def test_render_query_cache_size(mocker: MockerFixture):
+    mocker.patch("sqlmesh.core.renderer.RENDER_CACHE_SIZE", 2)
+
+    expressions = d.parse(
+        """
+        MODEL (name db.table, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+        SELECT @start_ds AS ds
+    """
+    )
+    model = t.cast(SqlModel, load_sql_based_model(expressions))
+    renderer = model._query_renderer
+
+    model.render_query(start="2023-01-01", end="2023-01-01")
+    model.render_query(start="2023-01-02", end="2023-01-02")
+    model.render_query(start="2023-01-01", end="2023-01-01")
+    model.render_query(start="2023-01-03", end="2023-01-03")
+
+    assert [key[0] for key in renderer._optimized_cache.keys()] == [
+        to_datetime("2023-01-01"),
+        to_datetime("2023-01-03"),
+    ]
+    assert len(renderer._cache) == 2
+
+
+def test_render_cache_concurrent(mocker: MockerFixture):
+    mocker.patch("sqlmesh.core.renderer.RENDER_CACHE_SIZE", 2)
+
+    cache: _RenderCache[t.List[int]] = _RenderCache()
+    keys = [
+        (to_datetime(day), to_datetime(day), to_datetime(day), RuntimeStage.LOADING)
+        for day in ("2023-01-01", "2023-01-02", "2023-01-03", "2023-01-04")
+    ]
+
+    def access(offset: int) -> None:
+        for i in range(5000):
+            index = (i + offset) % len(keys)
+            value = cache.get(keys[index])
+            if value is None:
+                cache.put(keys[index], [index])
+            else:
+                assert value == [index]
+
+    # Switch threads as often as possible to interleave reads, writes and evictions.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(access, offset) for offset in range(4)]:
+                future.result()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert len(cache) == 2
+
+
+def test_render_cache_copy() -> None:
+    expressions = d.parse(
+        """
+        MODEL (name db.table, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+        SELECT @start_ds AS ds
+    """
+    )
+    model = t.cast(SqlModel, load_sql_based_model(expressions))
+    model.render_query(start="2023-01-01", end="2023-01-01")
+    renderer = model._query_renderer
+
+    assert deepcopy(model)._query_renderer._optimized_cache.keys() == (
+        renderer._optimized_cache.keys()
+    )
+    assert pickle.loads(pickle.dumps(renderer))._cache.keys() == renderer._cache.keys()
+
+
+def test_render_static_query(mocker: MockerFixture):
+    static_model = t.cast(
+        SqlModel, load_sql_based_model(d.parse("MODEL (name db.static); SELECT a FROM b"))
+    )
+    macro_model = t.cast(
+        SqlModel, load_sql_based_model(d.parse("MODEL (name db.macro); SELECT @x AS a FROM b"))
+    )
+    assert static_model._query_renderer.is_static
+    assert not macro_model._query_renderer.is_static
+
+    evaluator_mock = mocker.patch("sqlmesh.core.renderer.MacroEvaluator")
+    rendered_query = static_model.render_query(optimize=False)
+    assert rendered_query is not None
+    assert rendered_query.sql() == 'SELECT "a" FROM "b" AS "b"'
+    evaluator_mock.assert_not_called()
+    assert rendered_query is not static_model.query
+
+
 def test_model_ctas_query():
     expressions = d.parse(
         """
@@ -1810,6 +1906,7 @@ def test_user_provided_depends_on():
     model = load_sql_based_model(expressions)
 
     assert model.depends_on == {"table_a", "table_b"}
+    assert model.depends_on_ == {"table_b"}
 
 
 def test_check_schema_mapping_when_rendering_at_runtime(assert_exp_eq):
@@ -2330,6 +2427,17 @@ def test_interval_unit_validation():
     )
 
 
+@pytest.mark.parametrize("interval_unit", list(IntervalUnit))
+@pytest.mark.parametrize(
+    "value", ["2023-12-31 23:59:59", "2024-01-01 00:00:00", "2024-02-29 12:15:00.000001"]
+)
+def test_interval_unit_cron_matches_croniter(interval_unit: IntervalUnit, value: str):
+    croniter = interval_unit.croniter(value)
+    assert interval_unit.cron_next(value) == croniter.get_next()
+    assert interval_unit.cron_floor(value) == croniter.get_prev()
+    assert interval_unit.cron_prev(value) == interval_unit.croniter(value).get_prev()
+
+
 def test_scd_type_2_defaults():
     view_model_expressions = d.parse(
         """
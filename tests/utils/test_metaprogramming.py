@@ -56,6 +56,25 @@ RuntimeError: error
     out_mock.write.assert_called_once_with(expected_message)
 
 
+def test_prepare_env_isolated():
+    test_env = {
+        "counter": Executable(
+            name="counter",
+            payload="""def counter():
+    global calls
+    calls = globals().get("calls", 0) + 1
+    return calls""",
+        ),
+    }
+    env_a = prepare_env(test_env)
+    env_b = prepare_env(test_env)
+
+    assert env_a["counter"] is not env_b["counter"]
+    assert env_a["counter"]() == 1
+    assert env_a["counter"]() == 2
+    assert env_b["counter"]() == 1
+
+
 X = 1
 Y = 2
 Z = 3
@@ -81,7 +81,7 @@ async def write_file(
 
             try:
                 expressions = parse(content, default_dialect=default_dialect)
-                content = format_model_expressions(expressions, dialect)
+                content = format_model_expressions(expressions, dialect, copy=False)
             except Exception:
                 error = ApiException(
                     message="Unable to format SQL file",